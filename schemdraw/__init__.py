@@ -1,4 +1,4 @@
-from .schemdraw import Drawing, use, config, theme, debug
+from .schemdraw import Drawing, use, config, theme, list_themes, debug
 from .segments import Segment, SegmentCircle, SegmentArc, SegmentText, SegmentPoly, SegmentBezier, SegmentPath
 from .transform import Transform
 from .types import ImageFormat
@@ -6,7 +6,7 @@ from .backends.svg import config as svgconfig
 from .backends.svg import settextmode
 
 __all__ = [
-    "Drawing", "use", "config", "theme", "debug", "Segment", "SegmentCircle", "SegmentArc", "SegmentText",
+    "Drawing", "use", "config", "theme", "list_themes", "debug", "Segment", "SegmentCircle", "SegmentArc", "SegmentText",
     "SegmentPath",
     "SegmentPoly", "SegmentBezier", "Transform", "ImageFormat", "settextmode", "svgconfig"
 ]
@@ -3,19 +3,41 @@
 from __future__ import annotations
 from typing import Optional, Sequence, BinaryIO
 from io import BytesIO
+from functools import wraps
 import math
 
+import numpy as np
 import matplotlib  # type: ignore
 import matplotlib.pyplot as plt  # type: ignore
 from matplotlib import font_manager, transforms
 from matplotlib.patches import Arc, Rectangle, PathPatch, Path # type: ignore
 
 from .. import util
+from .. import default_canvas
 from ..types import Capstyle, Joinstyle, Linestyle, BBox, XY
+from .svg import Figure as svgFigure
 
 inline = 'inline' in matplotlib.get_backend()
 
 
+def drawing_command(method):
+    ''' Decorator for drawing methods. If the Figure is recording,
+        records top-level drawing commands so they can be replayed
+        on the SVG backend.
+    '''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._commands is None or not self._recording:
+            return method(self, *args, **kwargs)
+        self._commands.append((method.__name__, args, kwargs))
+        self._recording = False  # Don't record nested calls, such as bezier arrowheads
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._recording = True
+    return wrapper
+
+
 def fix_capstyle(capstyle):
     ''' Matplotlib uses 'projecting' rather than 'square' for some reason '''
     if capstyle == 'square':
@@ -33,6 +55,9 @@ class Figure:
             showbbox: Draw bounding box and margin box
             ax: Existing Matplotlib axis to draw on
     '''
+    __slots__ = ('showbbox', 'bbox', 'inches_per_unit', 'ax', 'fig', 'userfig', 'margin',
+                 '_svgmargin', '_bgcolor', '_commands', '_recording', '_getfig_key')
+
     def __init__(self, **kwargs):
         self.showbbox = kwargs.get('showbbox', False)
         self.bbox = kwargs.get('bbox', None)
@@ -64,10 +89,19 @@ class Figure:
 
         # whitespace around contents
         self.margin = kwargs.get('margin', .1) + .03  # Plus half a line width for linecaps
+        self._svgmargin = kwargs.get('margin', .1)
+        self._bgcolor: Optional[str] = None
+        # Drawing calls, recorded only when SVG output should come from the
+        # SVG backend (schemdraw.use(prefer_svg_for_headless=True))
+        self._commands: Optional[list[tuple[str, tuple, dict]]] = (
+            [] if default_canvas.prefer_svg_for_headless else None)
+        self._recording = True
+        self._getfig_key: Optional[tuple] = None  # (bbox, showbbox) when getfig was last run
 
     def set_bbox(self, bbox: BBox):
         ''' Set bounding box, to override Matplotlib's autoscale '''
         self.bbox = bbox
+        self._getfig_key = None
 
     def show(self) -> None:
         ''' Display figure in interactive window. Does nothing
@@ -81,6 +115,7 @@ class Figure:
 
     def bgcolor(self, color: str) -> None:
         ''' Set background color of drawing '''
+        self._bgcolor = color
         self.fig.set_facecolor(color)
 
     def addclip(self, patch, clip):
@@ -91,6 +126,7 @@ class Figure:
                                  transform=self.ax.transData)
             patch.set_clip_path(cliprect)
 
+    @drawing_command
     def plot(self, x: float, y: float, color: str = 'black', ls: Linestyle = '-',
              lw: float = 2, fill: Optional[str] = None, capstyle: Capstyle = 'round',
              joinstyle: Joinstyle = 'round', clip: Optional[BBox] = None, zorder: int = 2) -> None:
@@ -103,6 +139,7 @@ class Figure:
             p, = self.ax.fill(x, y, color=fill, zorder=zorder-1)
             self.addclip(p, clip)
 
+    @drawing_command
     def text(self, s: str, x: float, y: float, color: str = 'black',
              fontsize: float = 14, fontfamily: str = 'sans-serif',
              mathfont: Optional[str] = None, rotation: float = 0,
@@ -124,6 +161,7 @@ class Figure:
                          zorder=zorder, clip_on=False)
         self.addclip(t, clip)
 
+    @drawing_command
     def poly(self, verts: Sequence[XY], closed: bool = True,
              color: str = 'black', fill: Optional[str] = None, lw: float = 2, ls: Linestyle = '-', hatch: bool = False,
              capstyle: Capstyle = 'round', joinstyle: Joinstyle = 'round', clip: Optional[BBox] = None, zorder: int = 1) -> None:
@@ -136,6 +174,7 @@ class Figure:
         self.ax.add_patch(p)
         self.addclip(p, clip)
 
+    @drawing_command
     def circle(self, center: XY, radius: float, color: str = 'black', fill: Optional[str] = None,
                lw: float = 2, ls: Linestyle = '-', clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw a circle '''
@@ -144,29 +183,33 @@ class Figure:
         self.ax.add_patch(circ)
         self.addclip(circ, clip)
 
+    @drawing_command
     def arrow(self, xy: XY, theta: float,
               arrowwidth: float = .15, arrowlength: float = .25,
               color: str = 'black', lw: float = 2, clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw an arrowhead '''
         # Easier to skip Matplotlib's arrow or annotate methods and just draw a line
         # and a polygon.
-        dx = arrowlength/2 * math.cos(math.radians(theta))
-        dy = arrowlength/2 * math.sin(math.radians(theta))
+        costh, sinth = math.cos(math.radians(theta)), math.sin(math.radians(theta))
+        dx = arrowlength/2 * costh
+        dy = arrowlength/2 * sinth
         x, y = xy
-        head = util.Point((x, y))
-        tail = util.Point((x-dx, y-dy))
-        fullen = math.sqrt(dx**2 + dy**2)
+        fullen = math.hypot(dx, dy)
 
-        # Endpoints of the arrow fins
-        fin1 = util.Point((fullen - arrowlength, arrowwidth/2)).rotate(theta) + tail
-        fin2 = util.Point((fullen - arrowlength, -arrowwidth/2)).rotate(theta) + tail
+        # Fin, head, fin points relative to the tail, rotated to theta
+        rot = np.array([[costh, -sinth], [sinth, costh]])
+        pts = np.array([[fullen - arrowlength, arrowwidth/2],
+                        [fullen, 0],
+                        [fullen - arrowlength, -arrowwidth/2]])
+        verts = pts @ rot.T + np.array([x-dx, y-dy])
 
-        p = plt.Polygon((fin1, head, fin2), closed=True, ec='none',
+        p = plt.Polygon(verts, closed=True, ec='none',
                         fc=color, fill=color is not None,
                         lw=lw, zorder=zorder)
         self.ax.add_patch(p)
         self.addclip(p, clip)
 
+    @drawing_command
     def bezier(self, p: Sequence[util.Point], color: str = 'black',
                lw: float = 2, ls: Linestyle = '-', capstyle: Capstyle = 'round', zorder: int = 1,
                arrow: Optional[str] = None, arrowlength: float = 0.25, arrowwidth: float = 0.15,
@@ -198,8 +241,7 @@ class Figure:
 
         if arrow is not None:
             if '<' in arrow:
-                delta = p[0] - p[1]
-                theta = math.degrees(math.atan2(delta.y, delta.x))
+                theta = math.degrees(math.atan2(p[0][1] - p[1][1], p[0][0] - p[1][0]))
                 self.arrow(p[0], theta, arrowlength=arrowlength,
                            arrowwidth=arrowwidth, color=color, zorder=zorder)
             elif arrow.startswith('o'):
@@ -207,14 +249,14 @@ class Figure:
                             clip=clip, zorder=zorder)
 
             if '>' in arrow:
-                delta = p[-1] - p[-2]
-                theta = math.degrees(math.atan2(delta.y, delta.x))
+                theta = math.degrees(math.atan2(p[-1][1] - p[-2][1], p[-1][0] - p[-2][0]))
                 self.arrow(p[-1], theta, arrowlength=arrowlength,
                            arrowwidth=arrowwidth, color=color, zorder=zorder)
             elif arrow.endswith('o'):
                 self.circle(p[-1], radius=arrowwidth/2, color=color, fill=color, lw=0,
                             clip=clip, zorder=zorder)
 
+    @drawing_command
     def path(self, path: Sequence[XY | str],
             color: str = 'black', lw: float = 2, ls: Linestyle = '-',
             fill: Optional[str] = None,
@@ -250,6 +292,7 @@ class Figure:
         self.ax.add_patch(curve)
         self.addclip(curve, clip)
 
+    @drawing_command
     def arc(self, center: XY, width: float, height: float,
             theta1: float = 0, theta2: float = 90, angle: float = 0,
             color: str = 'black', lw: float = 2, ls: Linestyle = '-',
@@ -307,6 +350,7 @@ class Figure:
                               head_length=.25, color=color, zorder=zorder)
             self.addclip(a, clip)
 
+    @drawing_command
     def image(self, image: str | BinaryIO, xy: XY, width: float, height: float,
               rotate: float = 0, zorder: int = 1, imgfmt: Optional[str] = None):
         ''' Add an image to the figure
@@ -338,6 +382,10 @@ class Figure:
 
     def save(self, fname: str, transparent: bool = True, dpi: float = 72) -> None:
         ''' Save the figure to a file '''
+        if fname.lower().endswith('.svg') and self._replay_svg():
+            self.getsvgfigure().save(fname)
+            return
+
         fig = self.getfig()
         fig.subplots_adjust(0, 0, 1, 1)
         fig.savefig(fname,
@@ -348,13 +396,19 @@ class Figure:
 
     def getfig(self):
         ''' Get the Matplotlib figure '''
+        key = (self.bbox, self.showbbox)
+        if key == self._getfig_key:
+            return self.fig  # Nothing changed since last call
+
         if self.showbbox:
+            self._recording = False
             self.plot((self.bbox.xmin, self.bbox.xmin, self.bbox.xmax, self.bbox.xmax, self.bbox.xmin),
                       (self.bbox.ymin, self.bbox.ymax, self.bbox.ymax, self.bbox.ymin, self.bbox.ymin),
                       color='red', lw=.5)
             self.plot((self.bbox.xmin-self.margin, self.bbox.xmin-self.margin, self.bbox.xmax+self.margin, self.bbox.xmax+self.margin, self.bbox.xmin-self.margin),
                       (self.bbox.ymin-self.margin, self.bbox.ymax+self.margin, self.bbox.ymax+self.margin, self.bbox.ymin-self.margin, self.bbox.ymin-self.margin),
                       color='black', lw=.5)
+            self._recording = True
 
         if not self.userfig:
             x1, x2 = self.bbox.xmin - self.margin, self.bbox.xmax + self.margin
@@ -371,10 +425,24 @@ class Figure:
                                                      self.inches_per_unit*h)
             except ValueError:
                 pass  # infinite size (no elements yet)
+        self._getfig_key = key
         return self.fig
 
+    def refresh(self, idle: bool = True) -> None:
+        ''' Repaint the figure canvas. With idle, the repaint is deferred
+            to the GUI event loop, which combines repeated requests.
+        '''
+        fig = self.getfig()
+        if idle:
+            fig.canvas.draw_idle()
+        else:
+            fig.canvas.draw()
+
     def getimage(self, ext='svg'):
         ''' Get the image as SVG or PNG bytes array '''
+        if ext == 'svg' and self._replay_svg():
+            return self.getsvgfigure().getimage('svg')
+
         fig = self.getfig()
         output = BytesIO()
         fig.savefig(output, format=ext,
@@ -384,9 +452,48 @@ class Figure:
 
         return output.getvalue()
 
+    def _replay_svg(self) -> bool:
+        ''' Whether SVG output should be replayed on the SVG backend '''
+        return self._commands is not None and not self.userfig and self.bbox is not None
+
+    def getsvgfigure(self) -> svgFigure:
+        ''' Replay the drawing commands on a native SVG backend Figure '''
+        fig = svgFigure(bbox=self.bbox, inches_per_unit=self.inches_per_unit,
+                        margin=self._svgmargin, showbbox=self.showbbox)
+        if self._bgcolor:
+            fig.bgcolor(self._bgcolor)
+        for name, args, kwargs in self._commands or ():
+            getattr(fig, name)(*args, **kwargs)
+        return fig
+
+    def mark(self) -> tuple[int, ...]:
+        ''' Get a handle to the current drawing state, for use with `rollback` '''
+        ax = self.ax
+        return (len(ax.lines), len(ax.patches), len(ax.texts),
+                len(ax.images), len(self._commands) if self._commands is not None else 0)
+
+    def rollback(self, mark: tuple[int, ...]) -> None:
+        ''' Remove everything drawn since `mark` was called '''
+        nlines, npatches, ntexts, nimages, ncommands = mark
+        ax = self.ax
+        for artists, n in ((ax.lines, nlines), (ax.patches, npatches),
+                           (ax.texts, ntexts), (ax.images, nimages)):
+            for artist in list(artists)[n:]:
+                artist.remove()
+        if self._commands is not None:
+            del self._commands[ncommands:]
+        self._getfig_key = None
+
+    def clear_content(self) -> None:
+        ''' Remove everything drawn, keeping the figure and axis settings '''
+        self.rollback((0, 0, 0, 0, 0))
+
     def clear(self) -> None:
         ''' Remove everything '''
         self.ax.clear()
+        if self._commands is not None:
+            self._commands = []
+        self._getfig_key = None
 
     def __repr__(self):
         if plt.isinteractive():
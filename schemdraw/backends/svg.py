@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from typing import Sequence, Optional, BinaryIO
 from xml.etree import ElementTree as ET
+from xml.sax.saxutils import quoteattr
 from collections import namedtuple
+from functools import lru_cache
 
 import os
 import sys
@@ -31,6 +33,7 @@ LINE_WIDTH = 2     # Default line width is 2 points
 class Config:
     ''' Configuration options for SVG backend '''
     _text: TextMode = 'path' if ziamath is not None else 'text'
+    _precision: float = 2  # Used when ziamath is not installed
 
     @property
     def text(self) -> TextMode:
@@ -71,16 +74,25 @@ class Config:
     @property
     def precision(self) -> float:
         ''' Decimal precision for SVG coordinates '''
-        return ziamath.config.precision
+        if ziamath is not None:
+            return ziamath.config.precision
+        return self._precision
 
     @precision.setter
     def precision(self, value: float) -> None:
-        ziamath.config.precision = value
+        if ziamath is not None:
+            ziamath.config.precision = value
+        self._precision = value
 
 
 config = Config()
 
 
+def _coordfmt() -> str:
+    ''' Format spec for coordinates of drawn elements (not viewBox) '''
+    return f'.{int(config.precision)}f'
+
+
 hatchpattern = '''<defs><pattern id="hatch" patternUnits="userSpaceOnUse" width="4" height="4">
 <path d="M-1,1 l2,-2 M0,4 l4,-4 M3,5 l2,-2" style="stroke:black; stroke-width:.5" /></pattern></defs>'''
 
@@ -118,10 +130,22 @@ def isnotebook():
 inline = isnotebook()
 
 
+_DASH_MAP = {'--': '7.4,3.2',
+             'dashed': '7.4,3.2',
+             ':': '2,3.3',
+             'dotted': '2,3.3',
+             '-.': '12.8,3.2,2,3.2',
+             'dashdot': '12.8,3.2,2,3.2',
+             }
+
+
+@lru_cache(maxsize=512, typed=True)
 def getstyle(color: Optional[str] = None, ls: Optional[Linestyle] = None, lw: Optional[float] = None,
              capstyle: Optional[Capstyle] = None, joinstyle: Optional[Joinstyle] = None,
              fill: Optional[str] = None, hatch: bool = False) -> str:
-    ''' Get style for svg element. Leave empty if property matches default '''
+    ''' Get style for svg element. Leave empty if property matches default.
+        Results are cached since most elements share a few styles.
+    '''
     # Note: styles are added to every SVG element, rather than in a global <style>
     # tag, since multiple images in one HTML page may share <styles>.
     s = ''
@@ -135,13 +159,7 @@ def getstyle(color: Optional[str] = None, ls: Optional[Linestyle] = None, lw: Op
         s += f'fill:{str(fill).lower()};'
     if lw:
         s += f'stroke-width:{lw};'
-    dash = {'--': '7.4,3.2',
-            'dashed': '7.4,3.2',
-            ':': '2,3.3',
-            'dotted': '2,3.3',
-            '-.': '12.8,3.2,2,3.2',
-            'dashdot': '12.8,3.2,2,3.2',
-            }.get(ls, None)  # type: ignore
+    dash = _DASH_MAP.get(ls)  # type: ignore
     if dash is not None:
         s += f'stroke-dasharray:{dash};'
     if capstyle:
@@ -154,6 +172,31 @@ def getstyle(color: Optional[str] = None, ls: Optional[Linestyle] = None, lw: Op
     return s
 
 
+def svgtag(tag: str, attrib: dict[str, str], contents: Optional[str] = None) -> str:
+    ''' Format an SVG element as a string
+
+        Args:
+            tag: Element tag, such as 'path'
+            attrib: Element attributes
+            contents: Serialized child elements. Element is
+                self-closing if None.
+    '''
+    attrs = ' '.join(f'{name}={quoteattr(value)}' for name, value in attrib.items())
+    if contents is None:
+        return f'<{tag} {attrs} />'
+    return f'<{tag} {attrs}>{contents}</{tag}>'
+
+
+@lru_cache(maxsize=1024)
+def ziatext(text: str, **kwargs) -> 'ziamath.Text':
+    ''' Create a ziamath Text object. Cached, since drawings often
+        repeat the same labels. The Text is shared between callers,
+        but drawon() writes new elements on each call.
+    '''
+    return ziamath.Text(text, **kwargs)
+
+
+@lru_cache(maxsize=2048)
 def text_size(text: str,
               font: Optional[str] = 'sans',
               mathfont: Optional[str] = None,
@@ -178,12 +221,43 @@ def text_size(text: str,
         if text == '':
             return (0, 0, 0)
 
-        m = ziamath.Text(text, size=size, mathstyle=font, textfont=font, mathfont=mathfont)
+        m = ziatext(text, size=size, mathstyle=font, textfont=font, mathfont=mathfont)
         return (*m.getsize(), m.getyofst())
 
     return svgtext.text_approx_size(text, font=font, size=size)
 
 
+def _arc_endpoints(centerx: float, centery: float, width: float, height: float,
+                   theta1: float, theta2: float, angle: float
+                   ) -> tuple[float, float, float, float, float, float]:
+    ''' Calculate start and end points of an elliptical arc, in svg pixel coords.
+
+        Args:
+            centerx, centery: Center of the ellipse
+            width, height: Full width and height of the ellipse
+            theta1, theta2: Start and end angles of the arc, in radians
+            angle: Rotation of the ellipse, in radians
+
+        Returns:
+            startx, starty, endx, endy, t1, t2 (parametric angles in radians)
+    '''
+    t1 = math.atan2(width*math.sin(theta1), height*math.cos(theta1))
+    t2 = math.atan2(width*math.sin(theta2), height*math.cos(theta2))
+    while t1 < t2:
+        t1 += 2*math.pi
+
+    cosa, sina = math.cos(angle), math.sin(angle)
+    startx = (centerx + width/2 * math.cos(t2)*cosa
+              - height/2 * math.sin(t2)*sina)
+    starty = (centery + width/2 * math.cos(t2)*sina
+              + height/2 * math.sin(t2)*cosa)
+    endx = (centerx + width/2 * math.cos(t1)*cosa
+            - height/2 * math.sin(t1)*sina)
+    endy = (centery + width/2 * math.cos(t1)*sina
+            + height/2 * math.sin(t1)*cosa)
+    return startx, starty, endx, endy, t1, t2
+
+
 class Figure:
     ''' Schemdraw figure drawn directly to SVG
 
@@ -192,12 +266,16 @@ class Figure:
             inches_per_unit: Scale for the drawing
             showbbox: Show frame around entire drawing
     '''
+    __slots__ = ('svgelements', 'hatch', 'clips', 'showbbox', 'scale', 'margin',
+                 'bbox', 'pxwidth', 'pxheight', '_bgcolor', '_need_xlink', 'svgcanvas',
+                 '_pendingpath')
+
     # Keep track of clipid's across all figures so they don't conflict
     # when multiple figures are in one Jupyter notebook/html file.
     total_clips = 0
 
     def __init__(self, bbox: BBox, **kwargs):
-        self.svgelements: list[tuple[int, ET.Element]] = []  # (zorder, element)
+        self.svgelements: dict[int, list[ET.Element | str]] = {}  # zorder: [element or svg string]
         self.hatch: bool = False
         self.clips: dict[BBox, int] = {}
         self.showbbox = kwargs.get('showbbox', False)
@@ -207,6 +285,7 @@ class Figure:
         self._bgcolor: Optional[str] = None
         self._need_xlink = False
         self.svgcanvas = kwargs.get('svg')
+        self._pendingpath: Optional[tuple[int, str, list[str]]] = None  # (zorder, style, path tokens)
 
     def set_bbox(self, bbox: BBox) -> None:
         ''' Set the bounding box '''
@@ -225,12 +304,30 @@ class Figure:
         ''' Convert x, y in user coords to svg pixel coords '''
         return Point((x*self.scale, -y*self.scale))
 
+    def xform_arr(self, x: Sequence[float], y: Sequence[float]) -> tuple[list[float], list[float]]:
+        ''' Convert sequences of x and y user coords to svg pixel coords '''
+        scale = self.scale
+        return [xx*scale for xx in x], [-yy*scale for yy in y]
+
     def bgcolor(self, color: str) -> None:
         ''' Set background color of drawing '''
         self._bgcolor = color
 
-    def addclip(self, et: ET.Element, bbox: Optional[BBox]):
-        ''' Add clip path to the element '''
+    def addelement(self, zorder: int, element: ET.Element | str) -> None:
+        ''' Add an element to the figure at the zorder '''
+        if self._pendingpath is not None:
+            self._flushpath()
+        self.svgelements.setdefault(zorder, []).append(element)
+
+    def _flushpath(self) -> None:
+        ''' Add the pending batch of plotted paths as a single <path> '''
+        zorder, style, tokens = self._pendingpath  # type: ignore
+        self._pendingpath = None
+        self.svgelements.setdefault(zorder, []).append(
+            svgtag('path', {'d': ' '.join(tokens), 'style': style}))
+
+    def addclip(self, attrib: dict[str, str], bbox: Optional[BBox]):
+        ''' Add clip path to the element attributes '''
         if bbox is not None:
             if bbox in self.clips:
                 clipid = self.clips[bbox]
@@ -241,33 +338,43 @@ class Figure:
 
                 x0, y0 = self.xform(bbox.xmin, bbox.ymin)
                 x1, y1 = self.xform(bbox.xmax, bbox.ymax)
-                clip = ET.fromstring(f'''<defs><clipPath id="clip{clipid}"><rect x="{x0-1}" y="{y0-1}"'''
-                                     f''' width="{x1-x0+2}" height="{y1-y0+2}" /></clipPath></defs>''')
-                self.svgelements.append((0, clip))
-            et.set('clip-path', f'url(#clip{clipid})')
+                clip = (f'''<defs><clipPath id="clip{clipid}"><rect x="{x0-1}" y="{y0-1}"'''
+                        f''' width="{x1-x0+2}" height="{y1-y0+2}" /></clipPath></defs>''')
+                self.addelement(0, clip)
+            attrib['clip-path'] = f'url(#clip{clipid})'
 
     def plot(self, x: XY, y: XY,
              color: str = 'black', ls: Linestyle = '-', lw: float = 2,
              fill: str = 'none', capstyle: Capstyle = 'round',
              joinstyle: Joinstyle = 'round', clip: Optional[BBox] = None, zorder: int = 2) -> None:
         ''' Plot a path '''
-        et = ET.Element('path')
-        d = 'M {},{} '.format(*self.xform(x[0], y[0]))
-        for xx, yy in zip(x[1:], y[1:]):
-            if str(xx) == 'nan' or str(yy) == 'nan':
-                d += 'M '
+        fmt = _coordfmt()
+        tokens = []
+        cmd = 'M'
+        for xx, yy in zip(*self.xform_arr(x, y)):
+            if math.isnan(xx) or math.isnan(yy):
+                cmd = 'M'  # Gap in the path. Start a new subpath at next point.
                 continue
-            elif not d.endswith('M '):
-                d += 'L '
-            xx, yy = self.xform(xx, yy)
-            d += f'{xx},{yy} '
-
-        d = d.strip()
-        et.set('d', d)
-        et.set('style', getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
-                                 joinstyle=joinstyle, fill=fill))
-        self.addclip(et, clip)
-        self.svgelements.append((zorder, et))
+            tokens.append(f'{cmd} {xx:{fmt}},{yy:{fmt}}')
+            cmd = 'L'
+
+        style = getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
+                         joinstyle=joinstyle, fill=fill)
+        if clip is None and (fill is None or fill == 'none'):
+            # Consecutive unfilled paths with the same style and zorder are
+            # combined as subpaths of one <path>
+            pending = self._pendingpath
+            if pending is not None and pending[0] == zorder and pending[1] == style:
+                pending[2].extend(tokens)
+            else:
+                if pending is not None:
+                    self._flushpath()
+                self._pendingpath = (zorder, style, tokens)
+            return
+
+        attrib = {'d': ' '.join(tokens), 'style': style}
+        self.addclip(attrib, clip)
+        self.addelement(zorder, svgtag('path', attrib))
 
     def text(self, s: str, x: float, y: float, color: str = 'black',
              fontsize: float = 14, fontfamily: str = 'sans',
@@ -294,9 +401,9 @@ class Figure:
 
         if ziamath and config.text == 'path':
             texttag = ET.Element('g')
-            ztext = ziamath.Text(s, textfont=fontfamily, mathfont=mathfont,
-                                 size=fontsize, linespacing=1, color=color,
-                                 rotation=rotation, rotation_mode=rotation_mode)
+            ztext = ziatext(s, textfont=fontfamily, mathfont=mathfont,
+                            size=fontsize, linespacing=1, color=color,
+                            rotation=rotation, rotation_mode=rotation_mode)
             ztext.drawon(texttag, x0, y0,
                          halign=halign, valign=valign)
         else:
@@ -305,24 +412,22 @@ class Figure:
                                          rotation=rotation, rotation_mode=rotation_mode,
                                          testmode=False)
         
-        self.addclip(texttag, clip)
-        self.svgelements.append((zorder, texttag))
+        self.addclip(texttag.attrib, clip)
+        self.addelement(zorder, texttag)
 
     def poly(self, verts: Sequence[XY], closed: bool = True,
              color: str = 'black', fill: str = 'none', lw: float = 2,
              ls: Linestyle = '-', hatch: bool = False, capstyle: Capstyle = 'round',
              joinstyle: Joinstyle = 'round', clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw a polygon '''
-        et = ET.Element('polyline') if not closed else ET.Element('polygon')
-        points = ''
-        for xx, yy in verts:
-            xx, yy = self.xform(xx, yy)
-            points += f'{xx},{yy} '
-        et.set('points', points)
-        et.set('style', getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
-                                 joinstyle=joinstyle, fill=fill, hatch=hatch))
-        self.addclip(et, clip)
-        self.svgelements.append((zorder, et))
+        fmt = _coordfmt()
+        xs, ys = self.xform_arr([v[0] for v in verts], [v[1] for v in verts])
+        points = ' '.join(f'{xx:{fmt}},{yy:{fmt}}' for xx, yy in zip(xs, ys))
+        attrib = {'points': points,
+                  'style': getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
+                                    joinstyle=joinstyle, fill=fill, hatch=hatch)}
+        self.addclip(attrib, clip)
+        self.addelement(zorder, svgtag('polygon' if closed else 'polyline', attrib))
         if hatch:
             self.hatch = True
 
@@ -330,48 +435,47 @@ class Figure:
                fill: str = 'none', lw: float = 2, ls: Linestyle = '-',
                clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw a circle '''
+        fmt = _coordfmt()
         x, y = self.xform(*center)
         radius = radius * self.scale
-        et = ET.Element('circle')
-        et.set('cx', str(x))
-        et.set('cy', str(y))
-        et.set('r', str(radius))
-        et.set('style', getstyle(color=color, lw=lw, ls=ls, fill=fill))
-        self.addclip(et, clip)
-        self.svgelements.append((zorder, et))
+        attrib = {'cx': f'{x:{fmt}}',
+                  'cy': f'{y:{fmt}}',
+                  'r': f'{radius:{fmt}}',
+                  'style': getstyle(color=color, lw=lw, ls=ls, fill=fill)}
+        self.addclip(attrib, clip)
+        self.addelement(zorder, svgtag('circle', attrib))
 
     def arrow(self, xy: XY, theta: float,
               arrowwidth: float = .15, arrowlength: float = .25,
               color: str = 'black', lw: float = 2, clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw an arrowhead '''
         x, y = self.xform(*xy)
-        dx = arrowlength/2 * math.cos(math.radians(theta)) * self.scale
-        dy = arrowlength/2 * math.sin(math.radians(theta)) * self.scale
+        # Arrow is rotated by -theta in svg coordinates (y axis points down)
+        costh, sinth = math.cos(math.radians(theta)), math.sin(math.radians(theta))
+        dx = arrowlength/2 * costh * self.scale
+        dy = arrowlength/2 * sinth * self.scale
         arrowwidth = arrowwidth*self.scale
         arrowlength = arrowlength*self.scale
 
         # Draw arrow as path
-        head = Point((x, y))
-        tail = Point((x-dx, y+dy))
-        fullen = math.sqrt(dx**2 + dy**2)
-        theta = -math.degrees(math.atan2(dy, dx))
-
-        fin1 = Point((fullen - arrowlength, arrowwidth/2)).rotate(theta) + tail
-        fin2 = Point((fullen - arrowlength, -arrowwidth/2)).rotate(theta) + tail
+        tailx, taily = x-dx, y+dy
+        fullen = math.hypot(dx, dy)
+        finx, finy = fullen - arrowlength, arrowwidth/2
+        fin1 = (finx*costh + finy*sinth + tailx, -finx*sinth + finy*costh + taily)
+        fin2 = (finx*costh - finy*sinth + tailx, -finx*sinth - finy*costh + taily)
 
         # Shrink arrow head by lw so it points right at the line
-        head = Point((head[0] - lw * 2 * math.cos(math.radians(theta)),
-                      head[1] - lw * 2 * math.sin(math.radians(theta))))
-
-        et1 = ET.Element('path')
-        d = f'M {head[0]} {head[1]} '
-        d += f'L {fin1[0]} {fin1[1]} '
-        d += f'L {fin2[0]} {fin2[1]} Z'
-        et1.set('d', d)
-        et1.set('style', getstyle(color=color, lw=0, capstyle='butt',
-                                  joinstyle='miter', fill=color))
-        self.addclip(et1, clip)
-        self.svgelements.append((zorder, et1))
+        head = (x - lw * 2 * costh, y + lw * 2 * sinth)
+
+        fmt = _coordfmt()
+        d = (f'M {head[0]:{fmt}} {head[1]:{fmt}} '
+             f'L {fin1[0]:{fmt}} {fin1[1]:{fmt}} '
+             f'L {fin2[0]:{fmt}} {fin2[1]:{fmt}} Z')
+        attrib = {'d': d,
+                  'style': getstyle(color=color, lw=0, capstyle='butt',
+                                    joinstyle='miter', fill=color)}
+        self.addclip(attrib, clip)
+        self.addelement(zorder, svgtag('path', attrib))
 
     def bezier(self, p: Sequence[Point], color: str = 'black',
                lw: float = 2, ls: Linestyle = '-', capstyle: Capstyle = 'round', zorder: int = 1,
@@ -393,28 +497,25 @@ class Figure:
         lpoints = [self.xform(*p0) for p0 in lpoints]
         order = 'C' if len(p) == 4 else 'Q'
 
-        et = ET.Element('path')
-        path = f'M {lpoints[0][0]} {lpoints[0][1]} {order}'
-        for p0 in lpoints[1:]:
-            path += f' {p0[0]} {p0[1]}'
-        et.set('d', path)
-        et.set('style', getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle))
-        self.addclip(et, clip)
-        self.svgelements.append((zorder, et))
+        fmt = _coordfmt()
+        path = ' '.join([f'M {lpoints[0][0]:{fmt}} {lpoints[0][1]:{fmt}} {order}'] +
+                        [f'{p0[0]:{fmt}} {p0[1]:{fmt}}' for p0 in lpoints[1:]])
+        attrib = {'d': path,
+                  'style': getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle)}
+        self.addclip(attrib, clip)
+        self.addelement(zorder, svgtag('path', attrib))
 
         if arrow is not None:
             # Note: using untransformed bezier control points here
             if '<' in arrow:
-                delta = p[0] - p[1]
-                theta = math.degrees(math.atan2(delta.y, delta.x))
+                theta = math.degrees(math.atan2(p[0][1] - p[1][1], p[0][0] - p[1][0]))
                 self.arrow(p[0], theta, color=color, lw=1, zorder=zorder,
                            clip=clip, arrowlength=arrowlength, arrowwidth=arrowwidth)
             elif arrow.startswith('o'):
                 self.circle(p[0], radius=arrowwidth/2, color=color, fill=color, lw=0,
                             clip=clip, zorder=zorder)
             if '>' in arrow:
-                delta = p[-1] - p[-2]
-                theta = math.degrees(math.atan2(delta.y, delta.x))
+                theta = math.degrees(math.atan2(p[-1][1] - p[-2][1], p[-1][0] - p[-2][0]))
                 self.arrow(p[-1], theta, color=color, lw=1, zorder=zorder,
                            clip=clip, arrowlength=arrowlength, arrowwidth=arrowwidth)
             elif arrow.endswith('o'):
@@ -429,20 +530,20 @@ class Figure:
             zorder: int = 1,
             clip: Optional[BBox] = None,
             ) -> None:
+        fmt = _coordfmt()
         dstrs = []
         for point in path:
             if isinstance(point, str):
                 dstrs.append(point)
             else:
                 x, y = self.xform(*point)
-                dstrs.append(f'{x}')
-                dstrs.append(f'{y}')
-        et = ET.Element('path')
-        et.set('d', ' '.join(dstrs))
-        et.set('style', getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
-                                 joinstyle=joinstyle, fill=fill))
-        self.addclip(et, clip)
-        self.svgelements.append((zorder, et))
+                dstrs.append(f'{x:{fmt}}')
+                dstrs.append(f'{y:{fmt}}')
+        attrib = {'d': ' '.join(dstrs),
+                  'style': getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
+                                    joinstyle=joinstyle, fill=fill)}
+        self.addclip(attrib, clip)
+        self.addelement(zorder, svgtag('path', attrib))
 
     def arc(self, center: XY, width: float, height: float,
             theta1: float = 0, theta2: float = 90, angle: float = 0,
@@ -453,92 +554,66 @@ class Figure:
         ''' Draw an arc or ellipse, with optional arrowhead '''
         centerx, centery = self.xform(*center)
         width, height = width*self.scale, height*self.scale
-        angle = -angle
-        theta1 = -theta1
-        theta2 = -theta2
-        anglerad = math.radians(angle)
-
-        theta1 = math.radians(theta1)
-        theta2 = math.radians(theta2)
-        t1 = math.atan2(width*math.sin(theta1), height*math.cos(theta1))
-        t2 = math.atan2(width*math.sin(theta2), height*math.cos(theta2))
-        while t1 < t2:
-            t1 += 2*math.pi
-
-        startx = (centerx + width/2 * math.cos(t2)*math.cos(anglerad)
-                  - height/2 * math.sin(t2)*math.sin(anglerad))
-        starty = (centery + width/2 * math.cos(t2)*math.sin(anglerad)
-                  + height/2 * math.sin(t2)*math.cos(anglerad))
-        endx = (centerx + width/2 * math.cos(t1)*math.cos(anglerad)
-                - height/2 * math.sin(t1)*math.sin(anglerad))
-        endy = (centery + width/2 * math.cos(t1)*math.sin(anglerad)
-                + height/2 * math.sin(t1)*math.cos(anglerad))
+        # Convert to radians once. Degrees are only needed for the SVG output.
+        theta1rad, theta2rad, anglerad = map(math.radians, (theta1, theta2, angle))
+        startx, starty, endx, endy, t1, t2 = _arc_endpoints(
+            centerx, centery, width, height, -theta1rad, -theta2rad, -anglerad)
 
         startx, starty = round(startx, 2), round(starty, 2)
         endx, endy = round(endx, 2), round(endy, 2)
         dx, dy = endx-startx, endy-starty
 
+        fmt = _coordfmt()
+        rx, ry = width/2, height/2
         if abs(dx) < .1 and abs(dy) < .1:
-            # Full ellipse - can't be drawn with a single <path>
-            # because when start/end points are the same it draws a dot.
-            et = ET.Element('ellipse')
-            et.set('cx', str(centerx))
-            et.set('cy', str(centery))
-            et.set('rx', str(width/2))
-            et.set('ry', str(height/2))
-            if angle != 0:
-                et.set('transform', f'rotate({angle} {centerx} {centery})')
-            et.set('style', getstyle(color=color, ls=ls, lw=lw, fill=fill))
-            self.addclip(et, clip)
-            self.svgelements.append((zorder, et))
-
+            # Full ellipse - a single arc draws a dot when start/end points
+            # are the same, so draw two halves through the opposite point.
+            ox, oy = 2*(centerx-startx), 2*(centery-starty)
+            arcs = (f' a {rx:{fmt}} {ry:{fmt}} {-angle} 1 1 {ox:{fmt}} {oy:{fmt}}'
+                    f' a {rx:{fmt}} {ry:{fmt}} {-angle} 1 1 {-ox:{fmt}} {-oy:{fmt}} Z')
         else:
             flags = '1 1' if abs(t2-t1) >= math.pi else '0 1'
-            et = ET.Element('path')
-            d = f'M {startx} {starty}'
-            d += f' a {width/2} {height/2} {angle} {flags} {dx} {dy}'
-            et.set('d', d)
-            et.set('style', getstyle(color=color, ls=ls, lw=lw, fill=fill))
-            self.addclip(et, clip)
-            self.svgelements.append((zorder, et))
+            arcs = (f' a {rx:{fmt}} {ry:{fmt}} {-angle} {flags}'
+                    f' {dx:{fmt}} {dy:{fmt}}')
+
+        attrib = {'d': f'M {startx:{fmt}} {starty:{fmt}}' + arcs,
+                  'style': getstyle(color=color, ls=ls, lw=lw, fill=fill)}
+        self.addclip(attrib, clip)
+        self.addelement(zorder, svgtag('path', attrib))
 
         if arrow is not None:
             # Note: This arrowhead's TAIL is located at the endpoint of the
             # arc curve. The arrow points beyond the arc's theta.
             # Back to user coordinates
             width, height = width/self.scale, height/self.scale
-            angle = -angle
-            theta1 = -math.degrees(theta1)
-            theta2 = -math.degrees(theta2)
 
             arrowlength = .25
             arrowwidth = .15
 
-            x, y = math.cos(math.radians(theta2)), math.sin(math.radians(theta2))
-            th2 = math.degrees(math.atan2((width/height)*y, x))
-            x, y = math.cos(math.radians(theta1)), math.sin(math.radians(theta1))
-            th1 = math.degrees(math.atan2((width/height)*y, x))
+            th2 = math.atan2((width/height)*math.sin(theta2rad), math.cos(theta2rad))
+            th1 = math.atan2((width/height)*math.sin(theta1rad), math.cos(theta1rad))
+            cosa, sina = math.cos(anglerad), math.sin(anglerad)
             if arrow in ['ccw', 'end', 'both'] or '>' in arrow:
-                dx = math.cos(math.radians(th2+90)) * arrowlength
-                dy = math.sin(math.radians(th2+90)) * arrowlength
-                xy = Point((center[0] + width/2*math.cos(math.radians(th2)),
-                            center[1] + height/2*math.sin(math.radians(th2))))
-                xy = Point(xy).rotate(angle, center)
-                darrow = Point((dx, dy)).rotate(angle)
-                theta = math.degrees(math.atan2(darrow.y, darrow.x))
-                self.arrow(xy+darrow, theta, arrowwidth=arrowwidth,
+                costh, sinth = math.cos(th2), math.sin(th2)
+                # Arrow tangent to the ellipse, rotated by angle about center
+                dx, dy = -sinth * arrowlength, costh * arrowlength
+                px, py = width/2*costh, height/2*sinth
+                darrowx, darrowy = dx*cosa - dy*sina, dx*sina + dy*cosa
+                xy = (center[0] + px*cosa - py*sina + darrowx,
+                      center[1] + px*sina + py*cosa + darrowy)
+                theta = math.degrees(math.atan2(darrowy, darrowx))
+                self.arrow(xy, theta, arrowwidth=arrowwidth,
                            arrowlength=arrowlength, color=color, lw=1, zorder=zorder)
 
             if arrow in ['cw', 'start', 'both'] or '<' in arrow:
-                dx = -math.cos(math.radians(th1+90)) * arrowlength
-                dy = -math.sin(math.radians(th1+90)) * arrowlength
-                xy = Point((center[0] + width/2*math.cos(math.radians(th1)),
-                            center[1] + height/2*math.sin(math.radians(th1))))
-
-                xy = Point(xy).rotate(angle, center)
-                darrow = Point((dx, dy)).rotate(angle)
-                theta = math.degrees(math.atan2(darrow.y, darrow.x))
-                self.arrow(xy+darrow, theta, arrowwidth=arrowwidth,
+                costh, sinth = math.cos(th1), math.sin(th1)
+                dx, dy = sinth * arrowlength, -costh * arrowlength
+                px, py = width/2*costh, height/2*sinth
+                darrowx, darrowy = dx*cosa - dy*sina, dx*sina + dy*cosa
+                xy = (center[0] + px*cosa - py*sina + darrowx,
+                      center[1] + px*sina + py*cosa + darrowy)
+                theta = math.degrees(math.atan2(darrowy, darrowx))
+                self.arrow(xy, theta, arrowwidth=arrowwidth,
                            arrowlength=arrowlength, color=color, lw=1, zorder=zorder)
 
     def image(self, image: str | BinaryIO, xy: XY, width: float, height: float,
@@ -586,7 +661,7 @@ class Figure:
             image_b64 = base64.encodebytes(imgdat).decode()
             et = ET.Element('image')
             et.set('xlink:href', f'data:image/{imgfmt};base64,{image_b64}')
-            self.svgelements.append((zorder, et))
+            self.addelement(zorder, et)
             self._need_xlink = True
 
             et.set('x', str(x0))
@@ -595,7 +670,7 @@ class Figure:
             et.set('height', str(height))
             if rotate:
                 et.set('transform', f'rotate({-rotate} {x0} {y0+height})')
-        self.svgelements.append((zorder, et))
+        self.addelement(zorder, et)
 
     def save(self, fname: str, **kwargs) -> None:
         ''' Save the figure to a file '''
@@ -606,46 +681,56 @@ class Figure:
         with open(fname, 'w', encoding='utf-8') as f:
             f.write(svg)
 
-    def getsvg(self) -> ET.Element:
-        ''' Get the image as SVG XML Tree '''
+    def _svgattrib(self) -> dict[str, str]:
+        ''' Get attributes of the root <svg> element '''
         x0 = self.bbox.xmin * self.scale
         y0 = -self.bbox.ymax * self.scale
+        attrib = {'xmlns': 'http://www.w3.org/2000/svg'}
+        if self._need_xlink:
+            attrib['xmlns:xlink'] = 'http://www.w3.org/1999/xlink'
+        attrib['xml:lang'] = 'en'
+        attrib['height'] = f'{self.pxheight}pt'
+        attrib['width'] = f'{self.pxwidth}pt'
+        attrib['viewBox'] = f'{x0} {y0} {self.pxwidth} {self.pxheight}'
+        if self._bgcolor:
+            attrib['style'] = f'background-color:{self._bgcolor};'
+        return attrib
+
+    def _getcontents(self) -> list[ET.Element | str]:
+        ''' Get all contents of the SVG, sorted by zorder '''
+        if self._pendingpath is not None:
+            self._flushpath()
+        contents: list[ET.Element | str] = []
+        if self.hatch:
+            contents.append(hatchpattern)
+
+        if self.showbbox:
+            contents.append(svgtag('rect', {
+                'x': str(self.bbox.xmin*self.scale),
+                'y': str(-self.bbox.ymax*self.scale),
+                'width': str(self.bbox.xmax*self.scale - self.bbox.xmin*self.scale),
+                'height': str(-self.bbox.ymin*self.scale + self.bbox.ymax*self.scale),
+                'style': 'fill:none; stroke-width:0.5; stroke:black;'}))
+            contents.append(svgtag('rect', {
+                'x': str((self.bbox.xmin+self.margin)*self.scale),
+                'y': str(-(self.bbox.ymax-self.margin)*self.scale),
+                'width': str((self.bbox.xmax-self.margin)*self.scale - (self.bbox.xmin+self.margin)*self.scale),
+                'height': str(-(self.bbox.ymin+self.margin)*self.scale + (self.bbox.ymax-self.margin)*self.scale),
+                'style': 'fill:none; stroke-width:1; stroke:red;'}))
+
+        for zorder in sorted(self.svgelements):
+            contents.extend(self.svgelements[zorder])
+        return contents
+
+    def getsvg(self) -> ET.Element:
+        ''' Get the image as SVG XML Tree '''
         if not self.svgcanvas:
-            svg = ET.Element('svg')
-            svg.set('xmlns', 'http://www.w3.org/2000/svg')
-            if self._need_xlink:
-                svg.set('xmlns:xlink', 'http://www.w3.org/1999/xlink')
-            svg.set('xml:lang', 'en')
-            svg.set('height', f'{self.pxheight}pt')
-            svg.set('width', f'{self.pxwidth}pt')
-            svg.set('viewBox', f'{x0} {y0} {self.pxwidth} {self.pxheight}')
-            if self._bgcolor:
-                svg.set('style', f'background-color:{self._bgcolor};')
+            svg = ET.Element('svg', self._svgattrib())
         else:
             svg = self.svgcanvas
 
-        if self.hatch:
-            svg.append(ET.fromstring(hatchpattern))
-
-        if self.showbbox:
-            rect = ET.SubElement(svg, 'rect')
-            rect.set('x', str(self.bbox.xmin*self.scale))
-            rect.set('y', str(-self.bbox.ymax*self.scale))
-            rect.set('width', str(self.bbox.xmax*self.scale - self.bbox.xmin*self.scale))
-            rect.set('height', str(-self.bbox.ymin*self.scale + self.bbox.ymax*self.scale))
-            rect.set('style', 'fill:none; stroke-width:0.5; stroke:black;')
-
-            rect = ET.SubElement(svg, 'rect')
-            rect.set('x', str((self.bbox.xmin+self.margin)*self.scale))
-            rect.set('y', str(-(self.bbox.ymax-self.margin)*self.scale))
-            rect.set('width', str((self.bbox.xmax-self.margin)*self.scale - (self.bbox.xmin+self.margin)*self.scale))
-            rect.set('height', str(-(self.bbox.ymin+self.margin)*self.scale + (self.bbox.ymax-self.margin)*self.scale))
-            rect.set('style', 'fill:none; stroke-width:1; stroke:red;')
-
-        # sort by zorder
-        elements = [k[1] for k in sorted(self.svgelements, key=lambda x: x[0])]
-        for elm in elements:
-            svg.append(elm)
+        for elm in self._getcontents():
+            svg.append(ET.fromstring(elm) if isinstance(elm, str) else elm)
         return svg
 
     def getimage(self, ext: str = 'svg') -> bytes:
@@ -653,12 +738,27 @@ class Figure:
         if ext.lower() != 'svg':
             raise ValueError('SVG backend only supports generating SVG format figures.')
 
-        svg = self.getsvg()
-        return ET.tostring(svg, encoding='utf-8')
+        if self.svgcanvas:
+            # Drawing into an existing SVG tree
+            return ET.tostring(self.getsvg(), encoding='utf-8')
+
+        # Most elements are already formatted as strings. Only
+        # text and images need to be serialized from ElementTree.
+        contents = ''.join(elm if isinstance(elm, str) else ET.tostring(elm, encoding='unicode')
+                           for elm in self._getcontents())
+        return svgtag('svg', self._svgattrib(), contents).encode('utf-8')
+
+    def clear_content(self) -> None:
+        ''' Remove everything drawn, keeping the figure settings '''
+        self.svgelements = {}
+        self._pendingpath = None
+        self.clips = {}
+        self.hatch = False
+        self._need_xlink = False
 
     def clear(self) -> None:
         ''' Remove everything '''
-        self.svgelements = []
+        self.clear_content()
 
     def _repr_svg_(self):
         ''' SVG representation for Jupyter '''
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from xml.etree import ElementTree as ET
+from functools import lru_cache
 import string
 import re
 
@@ -306,6 +307,7 @@ def string_width(st: str, fontsize: float = 12, font: str = 'Arial') -> float:
     return size * 72 / 1000.0 * (fontsize/12)  # to points
 
 
+@lru_cache(maxsize=2048)
 def text_approx_size(text: str, font: str = 'Arial', size: float = 16) -> tuple[float, float, float]:
     ''' Get approximate width, height and line spacing of multiline text
 
@@ -1,3 +1,10 @@
 ''' The default canvas to draw on '''
 
 default_canvas = 'matplotlib'
+
+# Draw on the native SVG backend instead of Matplotlib when the only
+# output is SVG data or an .svg file (Drawing.get_imagedata('svg'),
+# or Drawing(show=False) saving to an .svg file). Matplotlib figures
+# created while this is set also record their drawing calls, so their
+# SVG output is replayed on the SVG backend.
+prefer_svg_for_headless = False
@@ -11,7 +11,7 @@ from .. import default_canvas
 from ..segments import Segment, SegmentText, SegmentCircle, BBox, SegmentType
 from ..transform import Transform
 from .. import util
-from ..util import Point
+from ..util import Point, ORIGIN
 from ..types import XY, Linestyle, Halign, Valign, LabelLoc
 from .. import drawing_stack
 
@@ -65,9 +65,12 @@ class Element:
     '''
     _element_defaults: dict[str, Any] = {}     # Default parameters for subclassed elements
     defaults: ChainMap[str, Any] = ChainMap()  # Subclasses will chainmap this with parents  
+    _transform_version = 0  # Incremented whenever transform is replaced
+    _bbox_cache: Optional[tuple[tuple[int, int, bool], BBox]] = None  # Transformed bbox and its key
+
     def __init__(self, **kwargs) -> None:
         self._userparams.update(kwargs)         # Specified by user
-        self._localshift: XY = Point((0, 0))
+        self._localshift: XY = ORIGIN
         self._userlabels: list[Label] = []
 
         self.anchors: MutableMapping[str, Union[Point, tuple[float, float]]] = {}  # Untransformed anchors
@@ -102,6 +105,15 @@ class Element:
         else:
             self.defaults = ChainMap()
 
+    @property
+    def transform(self) -> Transform:
+        return self._transform
+
+    @transform.setter
+    def transform(self, value: Transform) -> None:
+        self._transform = value
+        self._transform_version += 1
+
     def __getattr__(self, name: str) -> Any:
         ''' Allow getting anchor position as attribute '''
         anchornames = ['start', 'end', 'center', 'istart', 'iend',
@@ -458,6 +470,12 @@ class Element:
             Returns:
                 Corners of the bounding box, (xmin, ymin, xmax, ymax)
         '''
+        if transform:
+            # Segments may be added (ie labels) after the transform is set
+            key = (self._transform_version, len(self.segments), includetext)
+            if self._bbox_cache is not None and self._bbox_cache[0] == key:
+                return self._bbox_cache[1]
+
         xmin = ymin = math.inf
         xmax = ymax = -math.inf
         for segment in self.segments:
@@ -471,7 +489,10 @@ class Element:
             ymin = min(ymin, segymin)
             ymax = max(ymax, segymax)
 
-        return BBox(xmin, ymin, xmax, ymax)
+        bbox = BBox(xmin, ymin, xmax, ymax)
+        if transform:
+            self._bbox_cache = (key, bbox)
+        return bbox
 
     def _position_label(self, label: Label, theta: float = 0) -> Label:
         ''' Calculate position of label
@@ -924,7 +945,7 @@ class Element2Term(Element):
             else:
                 start = Point(in_path[0])
                 end = Point(in_path[-1])
-                self._localshift = Point((0, 0))
+                self._localshift = ORIGIN
 
             # Adjust position of endpoints (arrowheads, dots, etc.)
             for i, segment in enumerate(self.segments):
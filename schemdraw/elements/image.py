@@ -4,7 +4,7 @@ from typing import Optional, BinaryIO
 
 from .elements import Element
 from ..segments import SegmentImage
-from ..util import Point
+from ..util import Point, ORIGIN
 
 
 class ElementImage(Element):
@@ -19,7 +19,7 @@ class ElementImage(Element):
     def __init__(self, image: str | BinaryIO,
                  width: float,
                  height: float,
-                 xy: Point = Point((0, 0)),
+                 xy: Point = ORIGIN,
                  imgfmt: Optional[str] = None,
                  **kwargs):
         super().__init__(**kwargs)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from typing import Any, MutableMapping, Union, Optional, TYPE_CHECKING
-from collections import ChainMap
+import itertools
 import warnings
 import math
 
@@ -10,7 +10,7 @@ from . import default_canvas
 from .types import BBox, Backends, ImageFormat, Linestyle, XY, ImageType
 from .elements import Element, Container
 from .segments import SegmentType
-from .util import Point
+from .util import Point, ORIGIN
 from .backends.svg import Figure as svgFigure
 from . import drawing_stack
 
@@ -27,12 +27,23 @@ except ImportError:
     default_canvas.default_canvas = 'svg'
 
 
-def use(backend: Backends = 'matplotlib') -> None:
-    ''' Change default backend, either 'matplotlib' or 'svg' '''
+def use(backend: Backends = 'matplotlib', prefer_svg_for_headless: Optional[bool] = None) -> None:
+    ''' Change default backend, either 'matplotlib' or 'svg'
+
+        Args:
+            backend: Default backend for new Drawings
+            prefer_svg_for_headless: Use the SVG backend, even when the default
+                is 'matplotlib', for Drawings that are only rendered to SVG
+                data or .svg files and not shown. Matplotlib figures created
+                while set also generate their SVG output with the SVG backend.
+                Unchanged if not provided.
+    '''
     if backend == 'matplotlib':
         if mplFigure is None:
             raise ValueError('Could not import Matplotlib.')
     default_canvas.default_canvas = backend
+    if prefer_svg_for_headless is not None:
+        default_canvas.prefer_svg_for_headless = prefer_svg_for_headless
 
 
 def config(unit: float = 3.0, inches_per_unit: float = 0.5,
@@ -71,6 +82,7 @@ def config(unit: float = 3.0, inches_per_unit: float = 0.5,
         schemdrawstyle['bgcolor'] = bgcolor
     if mathfont:
         schemdrawstyle['mathfont'] = mathfont
+    _style_changed()
 
 
 def debug(dwgbbox: bool = True,
@@ -78,12 +90,53 @@ def debug(dwgbbox: bool = True,
     ''' Debug - draw element and/or drawing bounding boxes '''
     schemdrawstyle['dwgbbox'] = dwgbbox
     schemdrawstyle['elmbbox'] = elmbbox
+    _style_changed()
+
+
+def _style_changed() -> None:
+    ''' Mark the global style as modified so the next Drawing takes a new snapshot '''
+    global _style_version
+    _style_version += 1
+
+
+def _get_style_snapshot() -> dict[str, Any]:
+    ''' Get a copy of the global style, shared between Drawings until the style changes.
+        Must not be modified.
+    '''
+    global _style_snapshot, _snapshot_version
+    if _snapshot_version != _style_version:
+        _style_snapshot = dict(schemdrawstyle)
+        _snapshot_version = _style_version
+    return _style_snapshot
 
 
 schemdrawstyle: dict[str, Any] = {}  # Global style
+_style_version = 0  # Incremented on every change to schemdrawstyle
+_style_snapshot: dict[str, Any] = {}
+_snapshot_version = -1
 config()  # Initialize default configuration
 
 
+_THEMES: dict[str, dict[str, str]] = {
+    'dark': {'color': 'white', 'bgcolor': 'black'},
+    'solarizedd': {'color': '#657b83', 'bgcolor': '#002b36'},
+    'solarizedl': {'color': '#073642', 'bgcolor': '#eee8d5'},
+    'onedork': {'color': '#899ab8', 'bgcolor': '#373e4b'},
+    'oceans16': {'color': '#CDD2E9', 'bgcolor': '#384151'},
+    'monokai': {'color': '#BBBBBB', 'bgcolor': '#232323'},
+    'gruvboxl': {'color': '#3c3836', 'bgcolor': '#ebdbb2'},
+    'gruvboxd': {'color': '#d5c4a1', 'bgcolor': '#1d2021'},
+    'grade3': {'color': '#3f3d46', 'bgcolor': '#ffffff'},
+    'chesterish': {'color': '#92A2BD', 'bgcolor': '#323A48'},
+}
+_VALID_THEMES = frozenset(_THEMES) | {'default'}
+
+
+def list_themes() -> list[str]:
+    ''' Get names of the available themes '''
+    return ['default', *_THEMES]
+
+
 def theme(theme='default'):
     ''' Set schemdraw theme (line color and background color).
         Themes match those in jupyter-themes package
@@ -102,40 +155,28 @@ def theme(theme='default'):
             * grade3
             * chesterish
     '''
+    if theme not in _VALID_THEMES:
+        raise ValueError(f'Unknown theme {theme}')
     if theme == 'default':
         config(bgcolor='white')
-    elif theme == 'dark':
-        schemdrawstyle['color'] = 'white'
-        schemdrawstyle['bgcolor'] = 'black'
-    elif theme == 'solarizedd':
-        schemdrawstyle['bgcolor'] = '#002b36'
-        schemdrawstyle['color'] = '#657b83'
-    elif theme == 'solarizedl':
-        schemdrawstyle['bgcolor'] = '#eee8d5'
-        schemdrawstyle['color'] = '#073642'
-    elif theme == 'onedork':
-        schemdrawstyle['bgcolor'] = '#373e4b'
-        schemdrawstyle['color'] = '#899ab8'
-    elif theme == 'oceans16':
-        schemdrawstyle['bgcolor'] = '#384151'
-        schemdrawstyle['color'] = '#CDD2E9'
-    elif theme == 'monokai':
-        schemdrawstyle['bgcolor'] = '#232323'
-        schemdrawstyle['color'] = '#BBBBBB'
-    elif theme == 'gruvboxl':
-        schemdrawstyle['bgcolor'] = '#ebdbb2'
-        schemdrawstyle['color'] = '#3c3836'
-    elif theme == 'gruvboxd':
-        schemdrawstyle['bgcolor'] = '#1d2021'
-        schemdrawstyle['color'] = '#d5c4a1'
-    elif theme == 'grade3':
-        schemdrawstyle['bgcolor'] = '#ffffff'
-        schemdrawstyle['color'] = '#3f3d46'
-    elif theme == 'chesterish':
-        schemdrawstyle['bgcolor'] = '#323A48'
-        schemdrawstyle['color'] = '#92A2BD'
-    else:
-        raise ValueError(f'Unknown theme {theme}')
+        return
+    schemdrawstyle.update(_THEMES[theme])
+    _style_changed()
+
+
+def _classify_canvas(canvas) -> str:
+    ''' Classify a canvas as 'mpl', 'mpl_axes', 'svg', 'svg_et' (ElementTree),
+        or 'default' (None, use schemdraw.use() setting)
+    '''
+    if canvas is None:
+        return 'default'
+    if canvas == 'matplotlib':
+        return 'mpl'
+    if canvas == 'svg':
+        return 'svg'
+    if hasattr(canvas, 'plot'):
+        return 'mpl_axes'
+    return 'svg_et'
 
 
 class Drawing:
@@ -175,15 +216,46 @@ class Drawing:
             warnings.warn('Use of `backend` is deprecated. Use `canvas`.',
                           DeprecationWarning, stacklevel=2)
 
-        self.dwgparams: dict[str, Any] = schemdrawstyle.copy()
-        self.dwgparams.update(kwargs)  # To maintain support for arguments that moved to config method
+        # kwargs maintain support for arguments that moved to config method.
+        # Without them, share the global style snapshot until dwgparams is accessed.
+        snapshot = _get_style_snapshot()
+        self._dwgparams: dict[str, Any] = {**snapshot, **kwargs} if kwargs else snapshot
+        self._dwgparams_shared = not kwargs
         self.unit = kwargs.get('unit', schemdrawstyle.get('unit'))
 
-        self._here: XY = Point((0, 0))
+        self._here: XY = ORIGIN
         self._theta: float = 0
         self._state: list[tuple[Point, float]] = []  # Push/Pop stack
         self._interactive = False
         self.fig: Optional[Union[mplFigure, svgFigure]] = None
+        self._bbox_cache: Optional[BBox] = None  # Running bbox of all elements
+        self._fig_marks: dict[Element, Any] = {}  # Interactive figure state before each element was drawn
+        self._pending_refresh = False  # Interactive figure changed since last refresh()
+
+    @property
+    def dwgparams(self) -> dict[str, Any]:
+        ''' Drawing style parameters. Copied from the shared global
+            style snapshot on first access, so changes stay local
+            to this Drawing.
+        '''
+        if self._dwgparams_shared:
+            self._dwgparams = dict(self._dwgparams)
+            self._dwgparams_shared = False
+        return self._dwgparams
+
+    @dwgparams.setter
+    def dwgparams(self, value: dict[str, Any]) -> None:
+        self._dwgparams = value
+        self._dwgparams_shared = False
+
+    @property
+    def canvas(self):
+        return self._canvas
+
+    @canvas.setter
+    def canvas(self, value):
+        self._canvas = value
+        self._canvas_kind = _classify_canvas(value)
 
     @property
     def here(self):
@@ -230,11 +302,11 @@ class Drawing:
         drawing_stack.push_element(None)
         drawing_stack.pop_drawing(self)
 
-        if self.outfile is not None:
+        if self.fig is None:
+            self.draw(show=False)  # Also saves to outfile
+        elif self.outfile is not None:
             self.save(self.outfile)
-        if not self.fig:
-            self.draw(show=False)
-        if self.show and not hasattr(self.canvas, 'plot'):
+        if self.show and self._canvas_kind != 'mpl_axes':
             try:
                 display(self.fig)
             except NameError:  # Not in Jupyter/IPython
@@ -242,8 +314,10 @@ class Drawing:
 
     def __getattr__(self, name: str) -> Any:
         ''' Allow getting anchor position as attribute '''
-        if name in vars(self).get('anchors', {}):
-            return vars(self).get('anchors')[name]  # type: ignore
+        if not name.startswith('__'):  # Probes like __array__ are never anchors
+            anchors = self.__dict__.get('anchors')
+            if anchors is not None and name in anchors:
+                return anchors[name]
         raise AttributeError(f"'Drawing' has no attribute {name}")
 
     def __contains__(self, element):
@@ -251,33 +325,51 @@ class Drawing:
 
     def interactive(self, interactive: bool = True):
         ''' Enable interactive mode (matplotlib backend only). Matplotlib
-            must also be set to interactive with `plt.ion()`.
+            must also be set to interactive with `plt.ion()`, which repaints
+            the changed figure when idle; call `refresh` to repaint immediately.
         '''
         self._interactive = interactive
 
     def get_bbox(self) -> BBox:
         ''' Get drawing bounding box '''
-        xmin = math.inf
-        xmax = -math.inf
-        ymin = math.inf
-        ymax = -math.inf
-        for element in self.elements:
-            bbox = element.get_bbox(transform=True)
-            xmin = min(bbox.xmin, xmin)
-            xmax = max(bbox.xmax, xmax)
-            ymin = min(bbox.ymin, ymin)
-            ymax = max(bbox.ymax, ymax)
-        return BBox(xmin, ymin, xmax, ymax)
+        if self._bbox_cache is not None:
+            return self._bbox_cache
+
+        bboxes = [element.get_bbox(transform=True) for element in self.elements]
+        if bboxes:
+            xmins, ymins, xmaxs, ymaxs = zip(*bboxes)
+            self._bbox_cache = BBox(min(xmins), min(ymins), max(xmaxs), max(ymaxs))
+        else:
+            self._bbox_cache = BBox(math.inf, math.inf, -math.inf, -math.inf)
+        return self._bbox_cache
+
+    def _extend_bbox(self, element: Element) -> bool:
+        ''' Fold a newly added element into the cached drawing bbox.
+            Returns False if the element is within the existing bbox.
+        '''
+        if self._bbox_cache is None:
+            return True  # Will be computed in full on next get_bbox
+        bbox = element.get_bbox(transform=True)
+        cache = self._bbox_cache
+        if (bbox.xmin >= cache.xmin and bbox.ymin >= cache.ymin and
+                bbox.xmax <= cache.xmax and bbox.ymax <= cache.ymax):
+            return False
+        self._bbox_cache = BBox(min(cache.xmin, bbox.xmin),
+                                min(cache.ymin, bbox.ymin),
+                                max(cache.xmax, bbox.xmax),
+                                max(cache.ymax, bbox.ymax))
+        return True
 
     def get_segments(self) -> list[SegmentType]:
         ''' Get flattened list of all segments in the drawing '''
-        segments = []
-        for element in self.elements:
-            # Exclude drawing params from the chain
-            params = ChainMap(element._userparams, element.elmparams, element.defaults)
-            segments.extend([s.xform(element.transform, **params)
-                             for s in element.segments])
-        return segments
+        def xformed(element: Element):
+            # Exclude drawing params from the merge. Later dicts take precedence.
+            params = {**element.defaults, **element.elmparams, **element._userparams}
+            transform = element.transform
+            return (s.xform(transform, **params) for s in element.segments)
+
+        return list(itertools.chain.from_iterable(
+            xformed(element) for element in self.elements))
 
     def _repr_svg_(self):
         ''' SVG representation for Jupyter '''
@@ -285,7 +377,7 @@ class Drawing:
 
     def _repr_png_(self):
         ''' PNG representation for Jupyter '''
-        if self.canvas == 'matplotlib' or hasattr(self.canvas, 'plot'):
+        if self._canvas_kind in ('mpl', 'mpl_axes'):
             return self.draw(show=False).getimage('png')
         return None
 
@@ -300,20 +392,29 @@ class Drawing:
             Args:
                 element: The element to add.
         '''
-        self._here, self._theta = element._place(self._here, self._theta, **self.dwgparams)
+        self._here, self._theta = element._place(self._here, self._theta, **self._dwgparams)
         self.elements.append(element)
+        grew = self._extend_bbox(element)
 
         if self._interactive:
             if self.fig is None:
+                grew = True
                 self.fig = mplFigure(
-                    inches_per_unit=self.dwgparams.get('inches_per_unit'))
-                if 'bgcolor' in self.dwgparams:
-                    self.fig.bgcolor(self.dwgparams['bgcolor'])
+                    inches_per_unit=self._dwgparams.get('inches_per_unit'))
+                if 'bgcolor' in self._dwgparams:
+                    self.fig.bgcolor(self._dwgparams['bgcolor'])
+                self._fig_marks = {}
+            if not isinstance(self.fig, svgFigure):
+                self._fig_marks[element] = self.fig.mark()  # type: ignore
             element._draw(self.fig)
-            self.fig.set_bbox(self.get_bbox())  # type: ignore
-            self.fig.getimage()  # type: ignore
+            if grew:  # Extents, and getfig sizing, only change when the element reaches outside them
+                self.fig.set_bbox(self.get_bbox())  # type: ignore
+            if not isinstance(self.fig, svgFigure):
+                self.fig.getfig()  # type: ignore
+                self._pending_refresh = True
         else:
             self.fig = None  # Clear any existing figure
+            self._fig_marks = {}
         return element
 
     def add_elements(self, *elements: Element) -> None:
@@ -323,13 +424,35 @@ class Drawing:
 
     def undo(self) -> None:
         ''' Removes previously added element '''
-        self.elements.pop(-1)
-        self.fig.clear()  # type: ignore
-        for element in self.elements:
-            element._draw(self.fig)
+        removed = self.elements.pop(-1)
+        if self._bbox_cache is not None:
+            bbox = removed.get_bbox(transform=True)
+            cache = self._bbox_cache
+            if (bbox.xmin <= cache.xmin or bbox.ymin <= cache.ymin or
+                    bbox.xmax >= cache.xmax or bbox.ymax >= cache.ymax):
+                self._bbox_cache = None  # Removed element was on the boundary
+
+        mark = self._fig_marks.pop(removed, None)
+        if mark is not None:
+            self.fig.rollback(mark)  # type: ignore
+        else:
+            self.fig.clear()  # type: ignore
+            self._fig_marks = {}
+            for element in self.elements:
+                element._draw(self.fig)
         self._here, self._theta = self.elements[-1].absdrop
         self.fig.set_bbox(self.get_bbox())  # type: ignore
-        self.fig.getimage()  # type: ignore
+        if self._interactive and not isinstance(self.fig, svgFigure):
+            self.fig.getfig()  # type: ignore
+            self._pending_refresh = True
+
+    def refresh(self) -> None:
+        ''' Repaint the interactive figure now, rather than waiting
+            for the Matplotlib event loop
+        '''
+        if self._pending_refresh and self.fig is not None:
+            self.fig.refresh(idle=False)  # type: ignore
+            self._pending_refresh = False
 
     def move(self, dx: float = 0, dy: float = 0) -> None:
         ''' Move the current drawing position
@@ -346,7 +469,7 @@ class Drawing:
             theta if provided.
         '''
         drawing_stack.push_element(None)
-        self._here = (ref.x + dx, ref.y + dy)
+        self._here = Point((ref.x + dx, ref.y + dy))
         if theta is not None:
             self._theta = theta
 
@@ -359,7 +482,8 @@ class Drawing:
             Drawing.here and Drawing.theta are saved.
         '''
         drawing_stack.push_element(None)
-        self._state.append((Point(self._here), self._theta))
+        here = self._here if isinstance(self._here, Point) else Point(self._here)
+        self._state.append((here, self._theta))
 
     def pop(self) -> None:
         ''' Pop/load the drawing state. Location and angle are returned to
@@ -421,25 +545,32 @@ class Drawing:
 
     def _drawmpl(self, ax=None):
         ''' Draw on Matplotlib Axis '''
-        if self.fig is None or ax is not None:
+        if self.fig is None or isinstance(self.fig, svgFigure) or ax is not None:
             self.fig = mplFigure(ax=ax,
-                                 inches_per_unit=self.dwgparams.get('inches_per_unit'),
-                                 margin=self.dwgparams['margin'],
-                                 showbbox=self.dwgparams.get('dwgbbox', False))
-            if 'bgcolor' in self.dwgparams:
-                self.fig.bgcolor(self.dwgparams['bgcolor'])
+                                 inches_per_unit=self._dwgparams.get('inches_per_unit'),
+                                 margin=self._dwgparams['margin'],
+                                 showbbox=self._dwgparams.get('dwgbbox', False))
+            if 'bgcolor' in self._dwgparams:
+                self.fig.bgcolor(self._dwgparams['bgcolor'])
+        else:
+            self.fig.clear_content()  # Reuse the Matplotlib figure and axis
+        self._fig_marks = {}  # Marks only apply to the figure they were taken on
         self.fig.set_bbox(self.get_bbox())  # type: ignore
         self._drawelements()
 
     def _drawsvg(self, svg=None):
         ''' Draw on SVG canvas '''
-        if self.fig is None or svg is not None:
+        if not isinstance(self.fig, svgFigure) or svg is not None:
             self.fig = svgFigure(svg=svg, bbox=self.get_bbox(),
-                                 inches_per_unit=self.dwgparams.get('inches_per_unit'),
-                                 margin=self.dwgparams.get('margin'),
-                                 showbbox=self.dwgparams.get('dwgbbox', False))
-        if 'bgcolor' in self.dwgparams:
-            self.fig.bgcolor(self.dwgparams['bgcolor'])
+                                 inches_per_unit=self._dwgparams.get('inches_per_unit'),
+                                 margin=self._dwgparams.get('margin'),
+                                 showbbox=self._dwgparams.get('dwgbbox', False))
+        else:
+            self.fig.clear_content()
+            self.fig.set_bbox(self.get_bbox())
+        self._fig_marks = {}
+        if 'bgcolor' in self._dwgparams:
+            self.fig.bgcolor(self._dwgparams['bgcolor'])
         self._drawelements()
 
     def draw(self, show: bool = True,
@@ -460,31 +591,41 @@ class Drawing:
                           DeprecationWarning, stacklevel=2)
             canvas = backend
 
+        if (not show and not self.show and self.outfile is not None
+                and self._headless_svg(self.outfile, canvas)):
+            canvas = 'svg'
+        self._render(canvas)
+
+        if show:
+            # Show figure in window if not inline/Jupyter mode
+            self.fig.show()  # type: ignore
+
+        if self.outfile is not None:
+            self.save(self.outfile)
+
+        return self.fig  # Return Figure and let _repr_ display it
+
+    def _render(self, canvas=None) -> None:
+        ''' Draw the elements on the canvas, without showing or saving '''
         drawing_stack.push_element(None)
 
         if canvas is None:
-            canvas = self.canvas
-        if canvas is None:
+            canvas, kind = self.canvas, self._canvas_kind
+        else:
+            kind = _classify_canvas(canvas)
+        if kind == 'default':
             canvas = default_canvas.default_canvas
+            kind = _classify_canvas(canvas)
 
-        if canvas == 'matplotlib':
+        if kind == 'mpl':
             self._drawmpl()
-        elif hasattr(canvas, 'plot'):
+        elif kind == 'mpl_axes':
             self._drawmpl(ax=canvas)
-        elif canvas == 'svg':
+        elif kind == 'svg':
             self._drawsvg()
         else:
             self._drawsvg(canvas)
 
-        if show:
-            # Show figure in window if not inline/Jupyter mode
-            self.fig.show()  # type: ignore
-
-        if self.outfile is not None:
-            self.save(self.outfile)
-
-        return self.fig  # Return Figure and let _repr_ display it
-
     def save(self, fname: str, transparent: bool = True, dpi: float = 72) -> None:
         ''' Save figure to a file
 
@@ -495,10 +636,32 @@ class Drawing:
                 transparent: Save as transparent background, if available
                 dpi: Dots-per-inch for raster formats
         '''
-        if self.fig is None:
-            self.draw(show=False)
+        self._render_for(fname, headless=not self.show)
         self.fig.save(fname, transparent=transparent, dpi=dpi)  # type: ignore
 
+    def _headless_svg(self, fmt: str, canvas=None) -> bool:
+        ''' Whether SVG output in format or filename `fmt` should be drawn
+            on the SVG backend instead of Matplotlib (see schemdraw.use)
+        '''
+        kind = self._canvas_kind if canvas is None else _classify_canvas(canvas)
+        return (default_canvas.prefer_svg_for_headless
+                and kind in ('default', 'mpl')
+                and fmt.lower().endswith('svg'))
+
+    def _render_for(self, fmt: str, headless: bool = True) -> None:
+        ''' Render the figure, if not already rendered in a backend
+            that supports format or filename `fmt`
+        '''
+        if self.fig is None:
+            self._render('svg' if headless and self._headless_svg(fmt) else None)
+        elif (isinstance(self.fig, svgFigure)
+              and not fmt.lower().endswith('svg')
+              and (self._canvas_kind == 'mpl'
+                   or (self._canvas_kind == 'default'
+                       and default_canvas.default_canvas == 'matplotlib'))):
+            # Previously drawn on SVG backend for headless SVG output
+            self._render()
+
     def get_imagedata(self, fmt: ImageFormat | ImageType = 'svg') -> bytes:
         ''' Get image data as bytes array
 
@@ -509,8 +672,7 @@ class Drawing:
             Returns:
                 Image data as bytes
         '''
-        if self.canvas == 'svg' and fmt.lower() != 'svg':
+        if self._canvas_kind == 'svg' and fmt.lower() != 'svg':
             raise ValueError('Format not available in SVG backend.')
-        if self.fig is None:
-            self.draw(show=False)
+        self._render_for(fmt)
         return self.fig.getimage(ext=fmt)  # type: ignore
@@ -10,7 +10,7 @@ import math
 
 from .types import BBox, XY, Linestyle, Capstyle, Joinstyle, Arcdirection, EndRef, RotationMode, Halign, Valign
 from . import util
-from .util import Point
+from .util import Point, ORIGIN
 from .backends import svg
 
 
@@ -1012,7 +1012,7 @@ class SegmentImage:
     ''' PNG or SVG Image '''
     def __init__(self,
                  image: str | BinaryIO,
-                 xy: Point = Point((0, 0)),   # Lower Left
+                 xy: Point = ORIGIN,   # Lower Left
                  width: float = 3,
                  height: float = 1,
                  rotate: float = 0,
@@ -73,6 +73,9 @@ class Point(Tuple[float, float]):
         return Point(flip(self))
 
 
+ORIGIN = Point((0, 0))  # Shared (0, 0). Points are immutable tuples.
+
+
 def dot(a: XY, b: Tuple[Tuple[float, float], Tuple[float, float]]) -> Point:
     ''' Dot product of iterables a and b '''
     return Point([sum(starmap(mul, zip(a, col))) for col in zip(*b)])